@@ -173,6 +173,16 @@ class Domain:
         self.anonymous = False
 
         self._hash = None  # cache for __hash__()
+        self._col_indices_cache = {}  # cache for _compute_col_indices()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state.pop("_col_indices_cache", None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._col_indices_cache = {}
 
     # noinspection PyPep8Naming
     @classmethod
@@ -217,8 +227,15 @@ class Domain:
                 raise ValueError('Y has invalid shape')
             n_classes = Y.shape[1]
             places = get_places(n_classes)
-            for i, values in enumerate(Y.T):
-                if set(values) == {0, 1}:
+            # a column is discrete if it contains both and only 0 and 1
+            if isinstance(Y, np.ndarray) and Y.dtype.kind in "biufO":
+                is_zero, is_one = Y == 0, Y == 1
+                discrete = np.all(is_zero | is_one, axis=0) \
+                    & np.any(is_zero, axis=0) & np.any(is_one, axis=0)
+            else:
+                discrete = np.zeros(n_classes, dtype=bool)
+            for i, is_discrete in enumerate(discrete):
+                if is_discrete:
                     name = get_name('Class', i, places)
                     values = ['v1', 'v2']
                     class_vars.append(DiscreteVariable(name, values))
@@ -453,9 +470,35 @@ class Domain:
         else:
             return self
 
+    # Column selections are usually repeated (e.g. table[:, ["a", "b"]] in a
+    # loop), so results for hashable selections are cached
+    _COL_INDICES_CACHE_SIZE = 128
+
     def _compute_col_indices(self, col_idx):
         if col_idx is ...:
             return None, None
+
+        hashable = (str, Integral, Variable)
+        if isinstance(col_idx, hashable):
+            key = col_idx
+        elif isinstance(col_idx, (list, tuple)) \
+                and all(isinstance(col, hashable) for col in col_idx):
+            key = tuple(col_idx)
+        else:
+            return self.__compute_col_indices(col_idx)
+
+        cache = self._col_indices_cache
+        result = cache.get(key)
+        if result is None:
+            result = self.__compute_col_indices(col_idx)
+            if result[1] is not None:
+                result[1].flags.writeable = False
+            if len(cache) >= self._COL_INDICES_CACHE_SIZE:
+                cache.clear()
+            cache[key] = result
+        return result
+
+    def __compute_col_indices(self, col_idx):
         if isinstance(col_idx, np.ndarray) and col_idx.dtype == bool:
             return ([attr for attr, c in zip(self, col_idx) if c],
                     np.nonzero(col_idx))
@@ -67,7 +67,7 @@ class IsDefined(Filter):
         r = np.fromiter((not bn.anynan(inst._x) for inst in data),
                         dtype=bool, count=len(data))
         if self.negate:
-            r = np.logical_not(r)
+            np.logical_not(r, out=r)
         return data[r]
 
 
@@ -91,7 +91,7 @@ class HasClass(Filter):
 
         r = np.fromiter((not bn.anynan(inst._y) for inst in data), bool, len(data))
         if self.negate:
-            r = np.logical_not(r)
+            np.logical_not(r, out=r)
         return data[r]
 
 
@@ -226,9 +226,10 @@ class Values(Filter):
         else:
             sel, agg = np.zeros(N, bool), np.logical_or
         for cond in self.conditions:
-            sel = agg(sel, np.fromiter((cond(inst) for inst in data), bool, count=N))
+            agg(sel, np.fromiter((cond(inst) for inst in data), bool, count=N),
+                out=sel)
         if self.negate:
-            sel = np.logical_not(sel)
+            np.logical_not(sel, out=sel)
         return data[sel]
 
 
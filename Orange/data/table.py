@@ -1,11 +1,9 @@
-import operator
 import os
 import threading
 import warnings
 import weakref
 import zlib
 from collections.abc import Iterable, Sequence, Sized
-from functools import reduce
 from itertools import chain
 from numbers import Real, Integral
 from threading import Lock
@@ -130,14 +128,15 @@ class RowInstance(Instance):
             if not isinstance(value, Real):
                 raise TypeError("Expected primitive value, got '%s'" %
                                 type(value).__name__)
-            if key < len(self._x):
+            n_attrs = len(self._x)
+            if key < n_attrs:
                 self._x[key] = value
                 if self.sparse_x is not None:
                     self.table.X[self.row_index, key] = value
             else:
-                self._y[key - len(self._x)] = value
+                self._y[key - n_attrs] = value
                 if self.sparse_y is not None:
-                    self.table._Y[self.row_index, key - len(self._x)] = value
+                    self.table._Y[self.row_index, key - n_attrs] = value
         else:
             self._metas[-1 - key] = value
             if self.sparse_metas:
@@ -207,6 +206,7 @@ class _ArrayConversion:
         self.dtype = dtype
         self.row_selection_needed = any(not isinstance(x, Integral)
                                         for x in src_cols)
+        self.direct_columns = self._direct_columns(src_cols, source_domain)
 
     def _can_copy_all(self, src_cols, source_domain):
         n_src_attrs = len(source_domain.attributes)
@@ -219,6 +219,30 @@ class _ArrayConversion:
                for x in src_cols):
             return "Y"
 
+    @staticmethod
+    def _direct_columns(src_cols, source_domain):
+        """
+        Group columns that are copied from the source table by the source
+        array (X, Y or metas), so that each group can be gathered at once.
+
+        Returns a list of tuples (array name, target indices, source indices).
+        """
+        n_src_attrs = len(source_domain.attributes)
+        parts = {"X": ([], []), "_Y": ([], []), "metas": ([], [])}
+        for i, col in enumerate(src_cols):
+            if not isinstance(col, Integral):
+                continue
+            if col < 0:
+                part, src_col = parts["metas"], -1 - col
+            elif col < n_src_attrs:
+                part, src_col = parts["X"], col
+            else:
+                part, src_col = parts["_Y"], col - n_src_attrs
+            part[0].append(i)
+            part[1].append(src_col)
+        return [(name, np.array(target, dtype=int), np.array(src, dtype=int))
+                for name, (target, src) in parts.items() if target]
+
     def get_subarray(self, source, row_indices, n_rows):
         if not len(self.src_cols):
             if self.is_sparse:
@@ -266,8 +290,22 @@ class _ArrayConversion:
             else:
                 sourceri = source[row_indices]
 
+        # dense columns copied from dense source arrays are gathered with
+        # a single fancy index per array instead of one index per column
+        gathered = np.zeros(len(self.src_cols), dtype=bool)
+        if not self.is_sparse:
+            rows = slice(None) if row_indices is ... else row_indices
+            for name, target_cols, src_cols in self.direct_columns:
+                arr = getattr(source, name)
+                if sp.issparse(arr):
+                    continue
+                out[target_indices, target_cols] = arr[_rxc_ix(rows, src_cols)]
+                gathered[target_cols] = True
+
         shared_cache = _thread_local.conversion_cache
         for i, col in enumerate(self.src_cols):
+            if gathered[i]:
+                continue
             if col is None:
                 col_array = match_density(
                     np.full((n_rows, 1), self.variables[i].Unknown)
@@ -637,7 +675,10 @@ class Table(Sequence, Storage):
         self.metas = source.metas[row_indices]
         if self.metas.ndim == 1:
             self.metas = self.metas.reshape(-1, len(self.domain.metas))
-        self.W = source.W[row_indices]
+        if source.has_weights():
+            self.W = source.W[row_indices]
+        else:
+            self.W = np.empty((self.X.shape[0], 0))
         self.name = getattr(source, 'name', '')
         self.ids = np.array(source.ids[row_indices])
         self.attributes = getattr(source, 'attributes', {})
@@ -729,6 +770,12 @@ class Table(Sequence, Storage):
         nattrs, ncls = len(domain.attributes), len(domain.class_vars)
         for i, row in enumerate(rows):
             if isinstance(row, Instance):
+                if row.domain is domain:
+                    # values are already encoded for this domain
+                    self.X[i] = row._x
+                    self._Y[i] = row._y
+                    self.metas[i] = row._metas
+                    continue
                 row = row.list
             for j, (var, val) in enumerate(zip(attrs, row)):
                 self.X[i, j] = var.to_val(val)
@@ -909,11 +956,11 @@ class Table(Sequence, Storage):
             if isinstance(col_idx, (str, Integral, Variable)):
                 col_idx = self.domain.index(col_idx)
                 var = self.domain[col_idx]
-                if 0 <= col_idx < len(self.domain.attributes):
+                n_attrs = self.X.shape[1]
+                if 0 <= col_idx < n_attrs:
                     val = self.X[row_idx, col_idx]
-                elif col_idx >= len(self.domain.attributes):
-                    val = self._Y[row_idx,
-                                  col_idx - len(self.domain.attributes)]
+                elif col_idx >= n_attrs:
+                    val = self._Y[row_idx, col_idx - n_attrs]
                 else:
                     val = self.metas[row_idx, -1 - col_idx]
                 if isinstance(col_idx, DiscreteVariable) and var is not col_idx:
@@ -973,16 +1020,17 @@ class Table(Sequence, Storage):
             if isinstance(col_idx, DiscreteVariable) \
                     and self.domain[col_idx] != col_idx:
                 values = self.domain[col_idx].get_mapper_from(col_idx)(values)
+            n_attrs = self.X.shape[1]
             for val, col_idx in zip(values, col_idx):
                 if not isinstance(val, Integral):
                     val = self.domain[col_idx].to_val(val)
                 if not isinstance(col_idx, Integral):
                     col_idx = self.domain.index(col_idx)
                 if col_idx >= 0:
-                    if col_idx < self.X.shape[1]:
+                    if col_idx < n_attrs:
                         self.X[row_idx, col_idx] = val
                     else:
-                        self._Y[row_idx, col_idx - self.X.shape[1]] = val
+                        self._Y[row_idx, col_idx - n_attrs] = val
                 else:
                     self.metas[row_idx, -1 - col_idx] = val
 
@@ -1002,12 +1050,12 @@ class Table(Sequence, Storage):
                 else:
                     self.metas[row_idx, -1 - col] = var.to_val(value)
         else:
-            attr_cols = np.fromiter(
-                (col for col in col_indices if 0 <= col < n_attrs), int)
-            class_cols = np.fromiter(
-                (col - n_attrs for col in col_indices if col >= n_attrs), int)
-            meta_cols = np.fromiter(
-                (-1 - col for col in col_indices if col < 0), int)
+            col_indices = np.asarray(col_indices, dtype=int)
+            is_class = col_indices >= n_attrs
+            is_meta = col_indices < 0
+            attr_cols = col_indices[~(is_class | is_meta)]
+            class_cols = col_indices[is_class] - n_attrs
+            meta_cols = -1 - col_indices[is_meta]
             if value is None:
                 value = Unknown
 
@@ -1170,19 +1218,15 @@ class Table(Sequence, Storage):
         """
         Return `True` if all arrays represent a view referring to another table
         """
-        return ((not self.X.shape[-1] or self.X.base is not None) and
-                (not self._Y.shape[-1] or self._Y.base is not None) and
-                (not self.metas.shape[-1] or self.metas.base is not None) and
-                (not self._weights.shape[-1] or self.W.base is not None))
+        return all(not arr.shape[-1] or arr.base is not None
+                   for arr in (self.X, self._Y, self.metas, self.W))
 
     def is_copy(self):
         """
         Return `True` if the table owns its data
         """
-        return ((not self.X.shape[-1] or self.X.base is None) and
-                (self._Y.base is None) and
-                (self.metas.base is None) and
-                (self.W.base is None))
+        return (not self.X.shape[-1] or self.X.base is None) and \
+            all(arr.base is None for arr in (self._Y, self.metas, self.W))
 
     def is_sparse(self):
         """
@@ -1259,7 +1303,7 @@ class Table(Sequence, Storage):
         they are unweighted.
         """
         if self.W.shape[-1]:
-            return sum(self.W)
+            return self.W.sum()
         return len(self)
 
     def has_missing(self):
@@ -1306,7 +1350,8 @@ class Table(Sequence, Storage):
         self.X = self.X[ind]
         self._Y = self._Y[ind]
         self.metas = self.metas[ind]
-        self.W = self.W[ind]
+        if self.has_weights():
+            self.W = self.W[ind]
 
     def get_column_view(self, index):
         """
@@ -1354,30 +1399,30 @@ class Table(Sequence, Storage):
             else:
                 remove = bn.anynan(self.X, axis=1)
             if sp.issparse(self._Y):
-                remove += _sp_anynan(self._Y)
-            else:
-                remove += bn.anynan(self._Y, axis=1)
+                remove |= _sp_anynan(self._Y)
+            elif self._Y.shape[1]:
+                remove |= bn.anynan(self._Y, axis=1)
             if sp.issparse(self.metas):
-                remove += _sp_anynan(self._metas)
+                remove |= _sp_anynan(self._metas)
             else:
                 for i, var in enumerate(self.domain.metas):
                     col = self.metas[:, i].flatten()
                     if var.is_primitive():
-                        remove += np.isnan(col.astype(float))
+                        remove |= np.isnan(col.astype(float))
                     else:
-                        remove += ~col.astype(bool)
+                        remove |= ~col.astype(bool)
         else:
             remove = np.zeros(len(self), dtype=bool)
             for column in columns:
                 col, sparse = self.get_column_view(column)
                 if sparse:
-                    remove += col == 0
+                    remove |= col == 0
                 elif self.domain[column].is_primitive():
-                    remove += bn.anynan([col.astype(float)], axis=0)
+                    remove |= bn.anynan([col.astype(float)], axis=0)
                 else:
-                    remove += col.astype(bool)
-        retain = remove if negate else np.logical_not(remove)
-        return self.from_table_rows(self, retain)
+                    remove |= col.astype(bool)
+        retain = remove if negate else np.logical_not(remove, out=remove)
+        return self.from_table_rows(self, _selection_indices(retain))
 
     def _filter_has_class(self, negate=False):
         if sp.issparse(self._Y):
@@ -1390,22 +1435,22 @@ class Table(Sequence, Storage):
         else:
             retain = bn.anynan(self._Y, axis=1)
             if not negate:
-                retain = np.logical_not(retain)
-        return self.from_table_rows(self, retain)
+                np.logical_not(retain, out=retain)
+        return self.from_table_rows(self, _selection_indices(retain))
 
     def _filter_same_value(self, column, value, negate=False):
         if not isinstance(value, Real):
             value = self.domain[column].to_val(value)
         sel = self.get_column_view(column)[0] == value
         if negate:
-            sel = np.logical_not(sel)
-        return self.from_table_rows(self, sel)
+            np.logical_not(sel, out=sel)
+        return self.from_table_rows(self, _selection_indices(sel))
 
     def _filter_values(self, filter):
         selection = self._values_filter_to_indicator(filter)
-        return self.from_table(self.domain, self, selection)
+        return self.from_table(self.domain, self, _selection_indices(selection))
 
-    def _values_filter_to_indicator(self, filter):
+    def _values_filter_to_indicator(self, filter, col_cache=None):
         """Return selection of rows matching the filter conditions
 
         Handles conjunction/disjunction and negate modifiers
@@ -1413,6 +1458,7 @@ class Table(Sequence, Storage):
         Parameters
         ----------
         filter: Values object containing the conditions
+        col_cache: dict of columns already retrieved by other conditions
 
         Returns
         -------
@@ -1426,29 +1472,43 @@ class Table(Sequence, Storage):
         else:
             conditions = [filter]
             conjunction = True
-        if conjunction:
-            sel = np.ones(len(self), dtype=bool)
+        if col_cache is None:
+            col_cache = {}
+        if len(conditions) == 1:
+            # the most common case; the condition's selection is a new
+            # array, so it can be used (and negated) directly
+            sel = self._filter_to_indicator(conditions[0], col_cache)
         else:
-            sel = np.zeros(len(self), dtype=bool)
-
-        for f in conditions:
-            selection = self._filter_to_indicator(f)
-
             if conjunction:
-                sel *= selection
+                sel = np.ones(len(self), dtype=bool)
             else:
-                sel += selection
+                sel = np.zeros(len(self), dtype=bool)
+
+            for f in conditions:
+                selection = self._filter_to_indicator(f, col_cache)
+
+                if conjunction:
+                    sel &= selection
+                    # no row can match any more
+                    if not np.count_nonzero(sel):
+                        break
+                else:
+                    sel |= selection
+                    # all rows already match
+                    if np.count_nonzero(sel) == len(sel):
+                        break
 
         if filter.negate:
-            sel = ~sel
+            np.logical_not(sel, out=sel)
         return sel
 
-    def _filter_to_indicator(self, filter):
+    def _filter_to_indicator(self, filter, col_cache=None):
         """Return selection of rows that match the condition.
 
         Parameters
         ----------
         filter: ValueFilter describing the condition
+        col_cache: dict of columns already retrieved by other conditions
 
         Returns
         -------
@@ -1459,7 +1519,18 @@ class Table(Sequence, Storage):
             FilterStringList, IsDefined, Values
         )
         if isinstance(filter, Values):
-            return self._values_filter_to_indicator(filter)
+            return self._values_filter_to_indicator(filter, col_cache)
+        if col_cache is None:
+            col_cache = {}
+
+        def get_column(col_idx):
+            # discrete variables with different values map to different
+            # columns, so values are a part of the key
+            key = col_idx, getattr(col_idx, "values", None)
+            col = col_cache.get(key)
+            if col is None:
+                col = col_cache[key] = self.get_column_view(col_idx)[0]
+            return col
 
         def get_col_indices():
             cols = chain(self.domain.variables, self.domain.metas)
@@ -1482,7 +1553,7 @@ class Table(Sequence, Storage):
             raise TypeError("Invalid filter")
 
         def col_filter(col_idx):
-            col = self.get_column_view(col_idx)[0]
+            col = get_column(col_idx)
             if isinstance(filter, IsDefined):
                 if self.domain[col_idx].is_primitive():
                     return ~np.isnan(col.astype(float))
@@ -1496,11 +1567,10 @@ class Table(Sequence, Storage):
                 return self._string_filter_to_indicator(filter, col)
             if isinstance(filter, FilterStringList):
                 if not filter.case_sensitive:
-                    col = np.char.lower(np.array(col, dtype=str))
-                    vals = [val.lower() for val in filter.values]
-                else:
-                    vals = filter.values
-                return reduce(operator.add, (col == val for val in vals))
+                    vals = {val.lower() for val in filter.values}
+                    return np.array([str(e).lower() in vals for e in col],
+                                    dtype=bool)
+                return np.isin(col, filter.values)
             if isinstance(filter, FilterRegex):
                 return np.vectorize(filter)(col)
             raise TypeError("Invalid filter")
@@ -1511,10 +1581,10 @@ class Table(Sequence, Storage):
         else:
             sel = np.ones(len(self), dtype=bool)
             for col_idx in col_indices:
-                sel *= col_filter(col_idx)
+                sel &= col_filter(col_idx)
 
         if isinstance(filter, IsDefined) and filter.negate:
-            sel = ~sel
+            np.logical_not(sel, out=sel)
         return sel
 
     def _discrete_filter_to_indicator(self, filter, col):
@@ -1533,12 +1603,14 @@ class Table(Sequence, Storage):
             col = col.astype(float)
             return ~np.isnan(col)
 
-        sel = np.zeros(len(self), dtype=bool)
-        for val in filter.values:
-            if not isinstance(val, Real):
-                val = self.domain[filter.column].to_val(val)
-            sel += (col == val)
-        return sel
+        var = self.domain[filter.column]
+        vals = [val if isinstance(val, Real) else var.to_val(val)
+                for val in filter.values]
+        if var.is_primitive():
+            # discrete metas are stored as objects; np.isin would compare
+            # them with each value in Python
+            col = col.astype(float, copy=False)
+        return np.isin(col, vals)
 
     def _continuous_filter_to_indicator(self, filter, col):
         """Return selection of rows matched by the given continuous filter.
@@ -1552,8 +1624,10 @@ class Table(Sequence, Storage):
         -------
         A 1d bool array. len(result) == len(self)
         """
+        # continuous metas are stored as objects; convert once, so that the
+        # comparisons below run on floats instead of Python objects
+        col = col.astype(float, copy=False)
         if filter.oper == filter.IsDefined:
-            col = col.astype(float)
             return ~np.isnan(col)
 
         return self._range_filter_to_indicator(filter, col, filter.min, filter.max)
@@ -1573,25 +1647,28 @@ class Table(Sequence, Storage):
         if filter.oper == filter.IsDefined:
             return col.astype(bool)
 
-        col = col.astype(str)
         fmin = filter.min or ""
         fmax = filter.max or ""
 
         if not filter.case_sensitive:
-            # convert all to lower case
-            col = np.char.lower(col)
+            # convert to strings and lower case in a single pass
+            col = np.array([str(e).lower() for e in col.tolist()], dtype=str)
             fmin = fmin.lower()
             fmax = fmax.lower()
+        else:
+            col = col.astype(str)
 
+        # iterating over a list yields str, which is much faster than
+        # boxing each element of a numpy array into np.str_; list
+        # comprehensions are also faster than np.fromiter with a generator
         if filter.oper == filter.Contains:
-            return np.fromiter((fmin in e for e in col),
-                               dtype=bool)
+            return np.array([fmin in e for e in col.tolist()], dtype=bool)
         if filter.oper == filter.StartsWith:
-            return np.fromiter((e.startswith(fmin) for e in col),
-                               dtype=bool)
+            return np.array([e.startswith(fmin) for e in col.tolist()],
+                            dtype=bool)
         if filter.oper == filter.EndsWith:
-            return np.fromiter((e.endswith(fmin) for e in col),
-                               dtype=bool)
+            return np.array([e.endswith(fmin) for e in col.tolist()],
+                            dtype=bool)
 
         return self._range_filter_to_indicator(filter, col, fmin, fmax)
 
@@ -1610,10 +1687,15 @@ class Table(Sequence, Storage):
                 return col > fmin
             if filter.oper == filter.GreaterEqual:
                 return col >= fmin
+            # combine the two comparisons in place to save a temporary
             if filter.oper == filter.Between:
-                return (col >= fmin) * (col <= fmax)
+                sel = col >= fmin
+                sel &= col <= fmax
+                return sel
             if filter.oper == filter.Outside:
-                return (col < fmin) + (col > fmax)
+                sel = col < fmin
+                sel |= col > fmax
+                return sel
 
             raise TypeError("Invalid operator")
 
@@ -2033,6 +2115,19 @@ def _subarray(arr, rows, cols):
     return arr[_rxc_ix(rows, cols)]
 
 
+def _selection_indices(sel):
+    """
+    Return indices of selected rows if only a few rows are selected, else
+    the boolean mask itself.
+
+    Gathering a few rows by index is faster than scanning the entire mask
+    for each of the table's arrays.
+    """
+    if np.count_nonzero(sel) < len(sel) // 8:
+        return np.flatnonzero(sel)
+    return sel
+
+
 def _optimize_indices(indices, maxlen):
     """
     Convert integer indices to slice if possible. It only converts increasing
@@ -2054,7 +2149,8 @@ def _optimize_indices(indices, maxlen):
         return slice(None, None, 1)
 
     # a very common case for column selection
-    if len(indices) == 1 and not isinstance(indices[0], bool):
+    if len(indices) == 1 and not isinstance(indices[0], (bool, np.bool_)) \
+            and -maxlen <= indices[0] < maxlen:
         if indices[0] >= 0:
             return slice(indices[0], indices[0] + 1, 1)
         else:
@@ -1,5 +1,6 @@
 # Test methods with long descriptive names can omit docstrings
 # pylint: disable=missing-docstring
+import pickle
 import warnings
 from time import time
 from numbers import Real
@@ -174,6 +175,18 @@ class TestDomainInit(unittest.TestCase):
             if isinstance(vartype, DiscreteVariable):
                 self.assertEqual(d.class_var.values, ["v{}".format(i) for i in range(1, 3)])
 
+    def test_from_numpy_multiple_classes(self):
+        Y = np.array([[0, 1, 0, 0, 1],
+                      [1, 1, 0, 1, 2],
+                      [0, 1, 0, np.nan, 1]]).T
+        d = Domain.from_numpy(np.zeros((5, 1)), Y)
+        self.assertEqual([type(var) for var in d.class_vars],
+                         [DiscreteVariable, ContinuousVariable,
+                          ContinuousVariable])
+
+        d = Domain.from_numpy(np.zeros((2, 1)), np.array([["a"], ["b"]]))
+        self.assertIsInstance(d.class_var, ContinuousVariable)
+
     def test_wrong_vartypes(self):
         attributes = (age, gender, income)
         for args in ((attributes, ssn),
@@ -232,6 +245,26 @@ class TestDomainInit(unittest.TestCase):
                          (-2, -2), (np.int_(-2), -2)]:
             self.assertEqual(d.index(idx), var)
 
+    def test_compute_col_indices_cache(self):
+        d = Domain((age, gender, income), metas=(ssn, race))
+        attrs, indices = d._compute_col_indices(["income", ssn, 0])
+        self.assertEqual(attrs, [income, ssn, age])
+        assert_array_equal(indices, [2, -1, 0])
+        self.assertIs(d._compute_col_indices(("income", ssn, 0))[1], indices)
+        self.assertFalse(indices.flags.writeable)
+
+        attrs, indices = d._compute_col_indices("SSN")
+        self.assertEqual(attrs, [ssn])
+        assert_array_equal(indices, [-1])
+
+        # unhashable selections are not cached, but still work
+        selection = np.array([True, False, True])
+        attrs, _ = d._compute_col_indices(selection)
+        self.assertEqual(attrs, [age, income])
+
+        d2 = pickle.loads(pickle.dumps(d))
+        self.assertEqual(d2._compute_col_indices([2, -1])[0], [income, ssn])
+
     def test_get_item_slices(self):
         d = Domain((age, gender, income, race), metas=(ssn, education))
         self.assertEqual(d[:2], (age, gender))
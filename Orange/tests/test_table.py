@@ -19,7 +19,7 @@ from Orange.data import (filter, Unknown, Variable, Table, DiscreteVariable,
                          ContinuousVariable, Domain, StringVariable)
 from Orange.data.util import SharedComputeValue
 from Orange.tests import test_dirname
-from Orange.data.table import _optimize_indices
+from Orange.data.table import _optimize_indices, _selection_indices
 
 
 class TableTestCase(unittest.TestCase):
@@ -448,6 +448,20 @@ class TableTestCase(unittest.TestCase):
         self.assertFalse(np.all(t.Y == copy.Y))
         self.assertFalse(np.all(t.metas == copy.metas))
 
+    def test_is_view_is_copy(self):
+        t = data.Table.from_numpy(
+            None, np.zeros((5, 3)), np.arange(5), np.zeros((5, 3)),
+            np.ones(5)).copy()
+        self.assertTrue(t.is_copy())
+        self.assertFalse(t.is_view())
+
+        view = t[1:3]
+        self.assertTrue(view.is_view())
+        self.assertFalse(view.is_copy())
+
+        view.ensure_copy()
+        self.assertTrue(view.is_copy())
+
     def test_copy_sparse(self):
         t = data.Table('iris').to_sparse()
         copy = t.copy()
@@ -738,6 +752,59 @@ class TableTestCase(unittest.TestCase):
         f = filter.Values([filter.Values([f1, f2], conjunction=False), f3])
         self.assertEqual(41, len(f(d)))
 
+    def test_filter_values_short_circuit(self):
+        d = data.Table("iris")
+        none = filter.FilterContinuous(d.columns.sepal_length,
+                                       filter.FilterContinuous.Less, ref=0)
+        every = filter.FilterContinuous(d.columns.sepal_length,
+                                        filter.FilterContinuous.Greater,
+                                        ref=0)
+        f3 = filter.FilterDiscrete(d.columns.iris, [0])
+
+        with patch.object(Table, "_filter_to_indicator",
+                          wraps=d._filter_to_indicator) as indicator:
+            self.assertEqual(len(filter.Values([none, f3])(d)), 0)
+            self.assertEqual(indicator.call_count, 1)
+            indicator.reset_mock()
+
+            f = filter.Values([every, f3], conjunction=False)
+            self.assertEqual(len(f(d)), 150)
+            self.assertEqual(indicator.call_count, 1)
+            indicator.reset_mock()
+
+            f = filter.Values([every, f3], conjunction=False, negate=True)
+            self.assertEqual(len(f(d)), 0)
+
+            self.assertEqual(len(filter.Values([every, f3])(d)), 50)
+            self.assertEqual(len(filter.Values([none, f3],
+                                               conjunction=False)(d)), 50)
+
+    def test_filter_values_same_column(self):
+        d = data.Table("iris")
+        var = d.domain["sepal length"]
+        f1 = filter.FilterContinuous(var, filter.FilterContinuous.Greater,
+                                     ref=5)
+        f2 = filter.FilterContinuous(var, filter.FilterContinuous.Less,
+                                     ref=6)
+        with patch.object(Table, "get_column_view",
+                          wraps=d.get_column_view) as get_column_view:
+            filtered = filter.Values([f1, f2])(d)
+            get_column_view.assert_called_once()
+        np.testing.assert_equal(
+            filtered.X, d.X[(d.X[:, 0] > 5) & (d.X[:, 0] < 6)])
+
+    def test_filter_discrete_meta(self):
+        d = data.Table("iris")
+        domain = data.Domain(d.domain.attributes,
+                             metas=d.domain.class_vars + (StringVariable("s"),))
+        d = d.transform(domain)
+        self.assertEqual(d.metas.dtype, object)
+
+        f = filter.FilterDiscrete(d.domain["iris"], ["Iris-setosa", 2])
+        filtered = filter.Values([f])(d)
+        self.assertEqual(len(filtered), 100)
+        self.assertEqual(set(filtered.metas[:, 0]), {0, 2})
+
     def test_filter_string_works_for_numeric_columns(self):
         var = StringVariable("s")
         data = Table.from_list(Domain([], metas=[var]),
@@ -1070,6 +1137,8 @@ class TableTestCase(unittest.TestCase):
             ((["swan", "tuna", "wasp"], False), dict(rows=3)),
             ((["WoRm", "TOad", "vOLe"], True), dict(rows=0)),
             ((["WoRm", "TOad", "vOLe"], False), dict(rows=3)),
+            (([], True), dict(rows=0)),
+            (([], False), dict(rows=0)),
         ]
 
         for args, expected in filters:
@@ -1410,6 +1479,17 @@ class CreateTableWithData(TableTests):
         self.assertEqual(table.domain, new_table.domain)
         np.testing.assert_array_equal(table.metas, new_table.metas)
 
+    def test_creates_a_table_from_list_of_instances_of_equal_domain(self):
+        domain = Domain([DiscreteVariable("a", values=("x", "y"))],
+                        metas=[StringVariable("s")])
+        table = data.Table.from_list(domain, [["x", "foo"], ["y", "bar"]])
+        other = Domain([DiscreteVariable("a", values=("y", "x"))],
+                       metas=[StringVariable("s")])
+        self.assertEqual(domain, other)
+        new_table = data.Table.from_list(other, [d for d in table])
+        np.testing.assert_equal(new_table.X, [[1], [0]])
+        np.testing.assert_equal(new_table.metas, [["foo"], ["bar"]])
+
     def test_creates_a_table_with_domain_and_given_X(self):
         domain = self.mock_domain()
 
@@ -1721,6 +1801,24 @@ class CreateTableWithDomainAndTable(TableTests):
         self.assert_table_with_filter_matches(
             new_table, self.table[:0], xcols=order[:a], ycols=order[a:a+c], mcols=order[a+c:])
 
+    def test_from_table_mixes_copied_and_computed_columns(self):
+        a, _, _ = column_sizes(self.table)
+        double = data.ContinuousVariable(
+            "double", compute_value=lambda t: t.X[:, 0] * 2)
+        vars_ = list(self.domain.variables) + list(self.domain.metas[::-1])
+        order = [a - 1, -1, 0, a, 2]
+        atrs = [vars_[i] for i in order[:2]] + [double] \
+            + [vars_[i] for i in order[2:]]
+
+        new_domain = self.create_domain(atrs)
+        new_table = data.Table.from_table(new_domain, self.table, [3, 0, 6])
+        magic = np.hstack((self.table.X, self.table.Y[:, None],
+                           self.table.metas[:, ::-1])).astype(float)
+        expected = np.hstack((magic[[3, 0, 6]][:, order[:2]],
+                              self.table.X[[3, 0, 6], :1] * 2,
+                              magic[[3, 0, 6]][:, order[2:]]))
+        np.testing.assert_almost_equal(new_table.X, expected)
+
     def test_from_table_sparse_move_some_to_empty_metas(self):
         iris = data.Table("iris").to_sparse()
         new_domain = data.domain.Domain(
@@ -1946,6 +2044,11 @@ class TableIndexingTests(TableTests):
 
         # leave boolean arrays
         np.testing.assert_equal(_optimize_indices([True, False, True], 3), [True, False, True])
+        np.testing.assert_equal(_optimize_indices(np.array([True]), 1), [True])
+
+        # single invalid indices must still raise on indexing
+        np.testing.assert_equal(_optimize_indices([5], 3), [5])
+        self.assertEqual(_optimize_indices([-3], 3), slice(-3, -4, -1))
 
         # do not convert if step is negative
         np.testing.assert_equal(_optimize_indices([4, 2, 0], 5), [4, 2, 0])
@@ -1961,6 +2064,17 @@ class TableIndexingTests(TableTests):
         self.assertEqual(_optimize_indices([1], 2), slice(1, 2, 1))
         self.assertEqual(_optimize_indices([-2], 5), slice(-2, -3, -1))
 
+    def test_selection_indices(self):
+        sel = np.zeros(100, dtype=bool)
+        sel[[3, 42]] = True
+        np.testing.assert_equal(_selection_indices(sel), [3, 42])
+
+        sel[:50] = True
+        self.assertIs(_selection_indices(sel), sel)
+
+        sel = np.zeros(0, dtype=bool)
+        self.assertIs(_selection_indices(sel), sel)
+
 
 class TableElementAssignmentTest(TableTests):
     def setUp(self):
@@ -0,0 +1,11 @@
+
+# THIS FILE IS GENERATED FROM ORANGE SETUP.PY
+short_version = '3.30.0'
+version = '3.30.0'
+full_version = '3.30.0.dev0+c52b8f0'
+git_revision = 'c52b8f09734e7eab73fcf505558e214eb0d24156'
+release = False
+
+if not release:
+    version = full_version
+    short_version += ".dev"